@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Consistency check for the optional Numba score kernel
+compute_scores only uses the kernel past NUMBA_MIN_ROWS, which real exports
+never reach, so this runs it on the export and compares it with pandas
+"""
+
+import sys
+
+from validate_swot_analysis import check_kernel_parity, load_and_analyze_data, njit
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else "Extended_Employee_Performance_and_Productivity_Data.csv"
+    
+    if njit is None:
+        print("numba is not installed; compute_scores always uses the pandas expressions")
+        sys.exit(0)
+    
+    employees = load_and_analyze_data(csv_path)
+    sys.exit(0 if check_kernel_parity(employees) else 1)
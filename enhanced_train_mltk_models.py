@@ -5,17 +5,75 @@ This version provides better SWOT distribution using percentile-based thresholds
 
 import pandas as pd
 import numpy as np
-from sklearn.cluster import KMeans
+
+# Route sklearn estimators through oneDAL kernels when
+# scikit-learn-intelex is available; must run before the sklearn imports
+try:
+    from sklearnex import patch_sklearn
+    patch_sklearn()
+except ImportError:
+    pass
+
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.ensemble import IsolationForest
 from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import StratifiedShuffleSplit
 from sklearn.metrics import classification_report, accuracy_score
+from mltk_common import UnionFeatureScaler, read_csv_columns
 import joblib
 import json
 import os
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SWOT_CATEGORIES = ['Strength', 'Opportunity', 'Weakness', 'Threat']
+ANOMALY_LEVELS = ['Low', 'Medium', 'High']
+ATTRITION_RISK_LEVELS = ['Very Low', 'Low', 'Medium', 'High', 'Very High']
+# Upper (inclusive) probability edges of every level but the last
+ATTRITION_RISK_BINS = np.array([0.1, 0.3, 0.5, 0.7])
+
+# Raw CSV columns consumed by feature engineering and reporting
+NUMERIC_COLUMNS = [
+    'Work_Hours_Per_Week', 'Overtime_Hours', 'Sick_Days',
+    'Employee_Satisfaction_Score', 'Performance_Score',
+    'Projects_Handled', 'Training_Hours', 'Years_At_Company',
+    'Promotions', 'Remote_Work_Frequency'
+]
+# Read columns in file order so both parsers return the same layout
+USECOLS = [
+    'Employee_ID', 'Department', 'Job_Title', 'Years_At_Company',
+    'Performance_Score', 'Work_Hours_Per_Week', 'Projects_Handled',
+    'Overtime_Hours', 'Sick_Days', 'Remote_Work_Frequency', 'Training_Hours',
+    'Promotions', 'Employee_Satisfaction_Score', 'Resigned'
+]
+DTYPES = {col: 'float32' for col in NUMERIC_COLUMNS}
+# The only fractional input; float32 would leak representation error into the scores
+DTYPES['Employee_Satisfaction_Score'] = 'float64'
+# Categorical so Department groupbys hash integer codes
+DTYPES['Department'] = 'category'
+
+def _swot_codes(prod, eng, risk, p25, p75, e25, e75, r25, r75):
+    """SWOT_CATEGORIES code for each employee; the first matching rule wins"""
+    # Strength: High productivity AND high engagement AND low risk
+    is_strength = (prod >= p75) & (eng >= e75) & (risk <= r25)
+    # Threat: High risk AND (low productivity OR low engagement)
+    is_threat = (risk >= r75) & ((prod <= p25) | (eng <= e25))
+    # Weakness: Low productivity AND low engagement
+    is_weakness = (prod <= p25) & (eng <= e25)
+    
+    # Opportunity: Everything else (moderate to good potential)
+    return np.select([is_strength, is_threat, is_weakness], [0, 3, 2], default=1).astype(np.int8)
+
 class OptimizedEmployeeSWOTMLTK:
     def __init__(self, data_path):
         """Initialize the enhanced MLTK trainer"""
@@ -25,19 +83,31 @@ class OptimizedEmployeeSWOTMLTK:
         self.model_dir = "models_optimized"
         os.makedirs(self.model_dir, exist_ok=True)
         
+        # Attrition features; risk_score is left out because it is built from Resigned
         self.feature_columns = [
-            'productivity_score', 'engagement_score', 'risk_score', 
+            'productivity_score', 'engagement_score',
             'Work_Hours_Per_Week', 'Overtime_Hours', 'Sick_Days', 
             'Employee_Satisfaction_Score', 'Performance_Score',
             'Projects_Handled', 'Training_Hours'
         ]
+        self.clustering_features = [
+            'productivity_score', 'engagement_score', 'risk_score', 
+            'work_life_balance_score', 'tenure_factor'
+        ]
+        self.anomaly_features = [
+            'productivity_score', 'engagement_score', 'risk_score', 
+            'Work_Hours_Per_Week', 'Sick_Days', 'Overtime_Hours',
+            'Employee_Satisfaction_Score', 'Performance_Score'
+        ]
         
         self.load_data()
+        self.prepare_feature_matrix()
+        self.prepare_train_test_split()
         
     def load_data(self):
         """Load and preprocess employee data"""
         print("Loading employee data...")
-        self.df = pd.read_csv(self.data_path)
+        self.df = read_csv_columns(self.data_path, USECOLS, DTYPES)
         print(f"Loaded {len(self.df)} employee records")
         self.create_features()
         
@@ -45,33 +115,55 @@ class OptimizedEmployeeSWOTMLTK:
         """Create enhanced productivity, engagement, and risk scores"""
         print("Engineering enhanced features...")
         
+        # Resigned arrives as bool or 'True'/'False' strings; normalize once
+        resigned_bool = self.df['Resigned'].astype(str).to_numpy() == 'True'
+        self.df['_resigned'] = resigned_bool.astype(np.int8)
+        
+        # Pull each source column once and build the scores with in-place NumPy
+        # ops, avoiding a temporary per pandas operator. Scores stay float64 so
+        # thresholds and exported aggregates carry no float32 rounding noise.
+        def col(name):
+            return self.df[name].to_numpy(dtype=np.float64)
+        
+        perf = col('Performance_Score')
+        hours = col('Work_Hours_Per_Week')
+        projects = col('Projects_Handled')
+        training = col('Training_Hours')
+        satisfaction = col('Employee_Satisfaction_Score')
+        promotions = col('Promotions')
+        remote = col('Remote_Work_Frequency')
+        sick = col('Sick_Days')
+        overtime = col('Overtime_Hours')
+        
         # Normalized Productivity Score (0-5 scale)
-        self.df['productivity_score'] = (
-            (self.df['Performance_Score'] * 1.2 + 
-             (self.df['Work_Hours_Per_Week']/50) * 2 + 
-             (self.df['Projects_Handled']/15) * 1.5 + 
-             (self.df['Training_Hours']/100) * 1.0 + 
-             (self.df['Employee_Satisfaction_Score']/5) * 1.3) / 5
-        ).clip(0, 5).round(2)
+        prod = perf * 1.2
+        prod += hours * (2 / 50)
+        prod += projects * (1.5 / 15)
+        prod += training * (1.0 / 100)
+        prod += satisfaction * (1.3 / 5)
+        prod /= 5
         
         # Enhanced Engagement Score (0-5 scale)
-        self.df['engagement_score'] = (
-            (self.df['Employee_Satisfaction_Score'] * 1.5 + 
-             (self.df['Training_Hours']/50) * 1.0 + 
-             (self.df['Promotions']*3) + 
-             (self.df['Remote_Work_Frequency']/100) * 0.5 - 
-             (self.df['Sick_Days']*0.3)) / 4
-        ).clip(0, 5).round(2)
+        eng = satisfaction * 1.5
+        eng += training * (1.0 / 50)
+        eng += promotions * 3
+        eng += remote * (0.5 / 100)
+        eng -= sick * 0.3
+        eng /= 4
         
         # Enhanced Risk Score (0-5 scale, lower is better)
-        resignation_risk = self.df['Resigned'].map({'True': 2.0, 'False': 0.0})
-        self.df['risk_score'] = (
-            (self.df['Sick_Days'] * 0.3 + 
-             self.df['Overtime_Hours']/15 + 
-             resignation_risk + 
-             (5 - self.df['Performance_Score']) * 0.4 + 
-             (5 - self.df['Employee_Satisfaction_Score']) * 0.3) / 5
-        ).clip(0, 5).round(2)
+        risk = resigned_bool.astype(np.float64) * 2.0
+        risk += sick * 0.3
+        risk += overtime / 15
+        risk += (5 - perf) * 0.4
+        risk += (5 - satisfaction) * 0.3
+        risk /= 5
+        
+        for name, score in (('productivity_score', prod),
+                            ('engagement_score', eng),
+                            ('risk_score', risk)):
+            np.clip(score, 0, 5, out=score)
+            self.df[name] = score
         
         # Additional factors
         self.df['work_life_balance_score'] = 5 - (self.df['Overtime_Hours'] / 10).clip(0, 5)
@@ -79,45 +171,42 @@ class OptimizedEmployeeSWOTMLTK:
         
         print("Enhanced feature engineering completed")
         
+    def prepare_feature_matrix(self):
+        """Standardize the union of all model features once"""
+        self.feature_matrix = UnionFeatureScaler(
+            self.df, [self.clustering_features, self.anomaly_features, self.feature_columns]
+        )
+        
+    def prepare_train_test_split(self):
+        """Cache stratified attrition train/test indices for reuse across fits"""
+        y = self.df['_resigned'].to_numpy()
+        if len(np.unique(y)) < 2:
+            self._tt_idx = None
+            return
+        splitter = StratifiedShuffleSplit(n_splits=1, test_size=0.2, random_state=42)
+        self._tt_idx = next(splitter.split(np.zeros(len(y)), y))
+        
     def assign_optimized_swot_categories(self):
         """Assign SWOT categories using percentile-based thresholds"""
         print("Assigning optimized SWOT categories...")
         
-        # Calculate percentiles for dynamic thresholds
-        prod_75 = self.df['productivity_score'].quantile(0.75)
-        prod_25 = self.df['productivity_score'].quantile(0.25)
-        eng_75 = self.df['engagement_score'].quantile(0.75)
-        eng_25 = self.df['engagement_score'].quantile(0.25)
-        risk_75 = self.df['risk_score'].quantile(0.75)
-        risk_25 = self.df['risk_score'].quantile(0.25)
+        prod = self.df['productivity_score'].to_numpy()
+        eng = self.df['engagement_score'].to_numpy()
+        risk = self.df['risk_score'].to_numpy()
+        
+        # Calculate percentiles for dynamic thresholds (one pass per column)
+        prod_25, prod_75 = np.percentile(prod, [25, 75])
+        eng_25, eng_75 = np.percentile(eng, [25, 75])
+        risk_25, risk_75 = np.percentile(risk, [25, 75])
         
         print(f"Threshold - Productivity: 25th={prod_25:.2f}, 75th={prod_75:.2f}")
         print(f"Threshold - Engagement: 25th={eng_25:.2f}, 75th={eng_75:.2f}")
         print(f"Threshold - Risk: 25th={risk_25:.2f}, 75th={risk_75:.2f}")
         
-        # Optimized SWOT assignment
-        def assign_swot(row):
-            prod = row['productivity_score']
-            eng = row['engagement_score']
-            risk = row['risk_score']
-            
-            # Strength: High productivity AND high engagement AND low risk
-            if prod >= prod_75 and eng >= eng_75 and risk <= risk_25:
-                return 'Strength'
-            
-            # Threat: High risk AND (low productivity OR low engagement)
-            elif risk >= risk_75 and (prod <= prod_25 or eng <= eng_25):
-                return 'Threat'
-            
-            # Weakness: Low productivity AND low engagement
-            elif prod <= prod_25 and eng <= eng_25:
-                return 'Weakness'
-            
-            # Opportunity: Everything else (moderate to good potential)
-            else:
-                return 'Opportunity'
-        
-        self.df['swot_category'] = self.df.apply(assign_swot, axis=1)
+        # Optimized SWOT assignment (vectorized, first matching rule wins)
+        codes = _swot_codes(prod, eng, risk, prod_25, prod_75, eng_25, eng_75, risk_25, risk_75)
+        # Stored as Categorical so counts/groupby/compares run on int8 codes
+        self.df['swot_category'] = pd.Categorical.from_codes(codes, categories=SWOT_CATEGORIES)
         
         # Store thresholds for future use
         self.swot_thresholds = {
@@ -131,19 +220,20 @@ class OptimizedEmployeeSWOTMLTK:
         print("="*60)
         print("Training Enhanced K-Means Clustering...")
         
-        features = ['productivity_score', 'engagement_score', 'risk_score', 
-                   'work_life_balance_score', 'tenure_factor']
-        X = self.df[features].fillna(0)
+        X_scaled, scaler = self.feature_matrix.subset(self.clustering_features)
         
         # Multiple clustering approaches
         results = {}
         
         # Standard K-Means
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
         
         for k in [3, 4, 5]:
-            kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
+            if k == 4:
+                # SWOT solution keeps exact full-batch centroids
+                kmeans = KMeans(n_clusters=k, random_state=42, n_init=10, algorithm='elkan')
+            else:
+                # K=3/5 only report inertia, so mini-batch fits are sufficient
+                kmeans = MiniBatchKMeans(n_clusters=k, random_state=42, n_init=3, batch_size=4096)
             clusters = kmeans.fit_predict(X_scaled)
             self.df[f'cluster_{k}'] = clusters
             results[f'kmeans_{k}'] = {
@@ -167,8 +257,8 @@ class OptimizedEmployeeSWOTMLTK:
         print(f"\nOptimized SWOT Distribution:")
         swot_counts = self.df['swot_category'].value_counts()
         swot_pcts = (swot_counts / len(self.df) * 100).round(1)
-        for category in ['Strength', 'Opportunity', 'Weakness', 'Threat']:
-            if category in swot_counts:
+        for category in SWOT_CATEGORIES:
+            if swot_counts[category]:
                 print(f"  {category:12}: {swot_counts[category]:6,} ({swot_pcts[category]:5.1f}%)")
         
     def train_enhanced_anomaly_detection(self):
@@ -176,43 +266,33 @@ class OptimizedEmployeeSWOTMLTK:
         print("="*60)
         print("Training Enhanced Anomaly Detection...")
         
-        features = ['productivity_score', 'engagement_score', 'risk_score', 
-                   'Work_Hours_Per_Week', 'Sick_Days', 'Overtime_Hours',
-                   'Employee_Satisfaction_Score', 'Performance_Score']
-        X = self.df[features].fillna(0)
-        
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
+        X_scaled, scaler = self.feature_matrix.subset(self.anomaly_features)
         
-        # Test different contamination levels
+        # Contamination only sets the offset on the decision scores, not the
+        # trees, so fit the forest once and derive each level's threshold
         contamination_levels = [0.05, 0.1, 0.15]
         best_contamination = 0.1
         
+        iso_forest = IsolationForest(contamination=best_contamination, random_state=42, n_jobs=-1)
+        iso_forest.fit(X_scaled)
+        scores = iso_forest.decision_function(X_scaled).astype(np.float32)
+        
         for contamination in contamination_levels:
-            iso_forest = IsolationForest(contamination=contamination, random_state=42)
-            outliers = iso_forest.fit_predict(X_scaled)
-            outlier_count = (outliers == -1).sum()
+            threshold = np.quantile(scores, contamination)
+            outlier_count = (scores < threshold).sum()
             print(f"  Contamination {contamination}: {outlier_count} outliers ({outlier_count/len(self.df)*100:.1f}%)")
         
-        # Train final model with best contamination
-        iso_forest = IsolationForest(contamination=best_contamination, random_state=42)
-        outliers = iso_forest.fit_predict(X_scaled)
-        
-        self.df['outlier'] = (outliers == -1).astype(int)
-        self.df['anomaly_score'] = iso_forest.decision_function(X_scaled)
-        
-        # Categorize anomaly severity
-        anomaly_threshold_high = np.percentile(self.df['anomaly_score'], 10)
-        anomaly_threshold_medium = np.percentile(self.df['anomaly_score'], 25)
-        
-        self.df['anomaly_level'] = np.select(
-            [
-                self.df['anomaly_score'] <= anomaly_threshold_high,
-                self.df['anomaly_score'] <= anomaly_threshold_medium,
-                self.df['anomaly_score'] > anomaly_threshold_medium
-            ],
-            ['High', 'Medium', 'Low'],
-            default='Low'
+        # decision_function is score_samples - offset_ for best_contamination,
+        # so negatives are exactly what predict() flags, without a second pass
+        self.df['outlier'] = (scores < 0).astype(np.int8)
+        self.df['anomaly_score'] = scores
+        
+        # Categorize anomaly severity: <= 10th pct is High, <= 25th is Medium
+        anomaly_thresholds = np.percentile(scores, [10, 25])
+        severity = np.searchsorted(anomaly_thresholds, scores)
+        self.df['anomaly_level'] = pd.Categorical.from_codes(
+            (len(ANOMALY_LEVELS) - 1 - severity).astype(np.int8),
+            categories=ANOMALY_LEVELS
         )
         
         self.models['isolation_forest'] = iso_forest
@@ -228,8 +308,7 @@ class OptimizedEmployeeSWOTMLTK:
         print("="*60)
         print("Training Enhanced Attrition Prediction...")
         
-        X = self.df[self.feature_columns].fillna(0)
-        y = self.df['Resigned'].map({'True': 1, 'False': 0}).fillna(0).astype(int)
+        y = self.df['_resigned'].astype(np.int8)
         
         print(f"Target distribution: {dict(pd.Series(y).value_counts())}")
         
@@ -237,14 +316,14 @@ class OptimizedEmployeeSWOTMLTK:
             print("⚠️ Insufficient target variation for attrition modeling")
             return
             
-        # Stratified split to maintain class balance
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42, stratify=y
-        )
+        # All employees are already standardized; train/test are row slices
+        X_all_scaled, scaler = self.feature_matrix.subset(self.feature_columns)
+        y = y.to_numpy()
         
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
+        # Stratified split to maintain class balance
+        train_idx, test_idx = self._tt_idx
+        X_train_scaled, X_test_scaled = X_all_scaled[train_idx], X_all_scaled[test_idx]
+        y_train, y_test = y[train_idx], y[test_idx]
         
         # Train with class balancing
         lr_model = LogisticRegression(
@@ -277,16 +356,15 @@ class OptimizedEmployeeSWOTMLTK:
             print(f"  {row['feature']:<25}: {row['importance']:.3f}")
         
         # Predict for all employees
-        X_scaled = scaler.transform(X)
-        probabilities = lr_model.predict_proba(X_scaled)[:, 1]
+        # Predicting on float32 features yields float32 probabilities, whose
+        # rounding error shows up in the export; score a float64 copy instead
+        probabilities = lr_model.predict_proba(X_all_scaled.astype(np.float64))[:, 1]
         self.df['attrition_probability'] = probabilities
         
         # Enhanced risk categorization
-        self.df['attrition_risk_level'] = pd.cut(
-            probabilities,
-            bins=[0, 0.1, 0.3, 0.5, 0.7, 1.0],
-            labels=['Very Low', 'Low', 'Medium', 'High', 'Very High'],
-            include_lowest=True
+        self.df['attrition_risk_level'] = pd.Categorical.from_codes(
+            np.searchsorted(ATTRITION_RISK_BINS, probabilities).astype(np.int8),
+            categories=ATTRITION_RISK_LEVELS
         )
         
         self.models['logistic_regression'] = lr_model
@@ -308,7 +386,7 @@ class OptimizedEmployeeSWOTMLTK:
             'dataset_summary': {
                 'total_employees': len(self.df),
                 'departments': self.df['Department'].nunique(),
-                'avg_tenure': self.df['Years_At_Company'].mean()
+                'avg_tenure': float(self.df['Years_At_Company'].to_numpy().mean(dtype=np.float64))
             },
             'swot_analysis': {},
             'risk_analysis': {},
@@ -332,31 +410,40 @@ class OptimizedEmployeeSWOTMLTK:
         }
         
         # Risk Analysis
-        high_risk_employees = self.df[
+        high_risk_mask = (
             (self.df['swot_category'] == 'Threat') |
-            (self.df.get('attrition_risk_level', pd.Series(['Low'] * len(self.df))).isin(['High', 'Very High'])) |
             (self.df['anomaly_level'] == 'High')
-        ]
+        )
+        if 'attrition_risk_level' in self.df.columns:
+            high_risk_mask |= self.df['attrition_risk_level'].isin(['High', 'Very High'])
+        high_risk_count = int(high_risk_mask.sum())
         
         insights['risk_analysis'] = {
-            'high_risk_count': len(high_risk_employees),
-            'high_risk_percentage': len(high_risk_employees) / len(self.df) * 100,
-            'avg_risk_score': self.df['risk_score'].mean(),
+            'high_risk_count': high_risk_count,
+            'high_risk_percentage': high_risk_count / len(self.df) * 100,
+            'avg_risk_score': float(self.df['risk_score'].mean()),
             'top_risk_factors': self._identify_risk_factors()
         }
         
         # Departmental Analysis
-        dept_analysis = self.df.groupby('Department').agg({
-            'swot_category': lambda x: (x == 'Threat').sum(),
+        agg_spec = {
             'Employee_ID': 'count',
             'productivity_score': 'mean',
             'engagement_score': 'mean',
             'risk_score': 'mean'
-        }).round(3)
+        }
         
         # Add attrition probability if available
         if 'attrition_probability' in self.df.columns:
-            dept_analysis['attrition_probability'] = self.df.groupby('Department')['attrition_probability'].mean().round(3)
+            agg_spec['attrition_probability'] = 'mean'
+        
+        dept_analysis = self.df.groupby('Department', observed=True).agg(agg_spec).round(3)
+        
+        # Threat counts via a boolean sum keep the groupby on the Cython path
+        threats_per_dept = (self.df['swot_category'] == 'Threat').groupby(
+            self.df['Department'], observed=True
+        ).sum()
+        dept_analysis.insert(0, 'swot_category', threats_per_dept)
         
         dept_analysis['threat_percentage'] = (
             dept_analysis['swot_category'] / dept_analysis['Employee_ID'] * 100
@@ -371,12 +458,20 @@ class OptimizedEmployeeSWOTMLTK:
     
     def _identify_risk_factors(self):
         """Identify top risk factors across the organization"""
+        ot, sat, sd, perf, tr = [
+            self.df[c].to_numpy() for c in (
+                'Overtime_Hours', 'Employee_Satisfaction_Score', 'Sick_Days',
+                'Performance_Score', 'Training_Hours'
+            )
+        ]
+        
+        # Count matches straight off the arrays; no filtered frames are built
         risk_factors = {
-            'high_overtime': len(self.df[self.df['Overtime_Hours'] > 20]),
-            'low_satisfaction': len(self.df[self.df['Employee_Satisfaction_Score'] < 2.5]),
-            'high_sick_days': len(self.df[self.df['Sick_Days'] > 10]),
-            'low_performance': len(self.df[self.df['Performance_Score'] < 3]),
-            'no_training': len(self.df[self.df['Training_Hours'] == 0])
+            'high_overtime': int((ot > 20).sum()),
+            'low_satisfaction': int((sat < 2.5).sum()),
+            'high_sick_days': int((sd > 10).sum()),
+            'low_performance': int((perf < 3).sum()),
+            'no_training': int((tr == 0).sum())
         }
         
         # Sort by prevalence
@@ -427,12 +522,21 @@ class OptimizedEmployeeSWOTMLTK:
         """Save all models with comprehensive metadata"""
         print("Saving enhanced models and insights...")
         
+        # LZ4 is optional; loading these files needs lz4 on the reader side too
+        try:
+            import lz4  # noqa: F401
+            compress = ('lz4', 3)
+        except ImportError:
+            compress = 0
+        
         # Save models and scalers
         for name, model in self.models.items():
-            joblib.dump(model, os.path.join(self.model_dir, f'{name}_enhanced.pkl'))
+            joblib.dump(model, os.path.join(self.model_dir, f'{name}_enhanced.pkl'),
+                        compress=compress, protocol=5)
             
         for name, scaler in self.scalers.items():
-            joblib.dump(scaler, os.path.join(self.model_dir, f'{name}_scaler_enhanced.pkl'))
+            joblib.dump(scaler, os.path.join(self.model_dir, f'{name}_scaler_enhanced.pkl'),
+                        compress=compress, protocol=5)
         
         # Save thresholds and configuration
         config = {
@@ -447,8 +551,16 @@ class OptimizedEmployeeSWOTMLTK:
         
         # Save comprehensive insights
         insights = self.generate_comprehensive_insights()
-        with open(os.path.join(self.model_dir, 'business_insights.json'), 'w') as f:
-            json.dump(insights, f, indent=2, default=str)
+        insights_path = os.path.join(self.model_dir, 'business_insights.json')
+        if orjson is not None:
+            with open(insights_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    insights, default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(insights_path, 'w') as f:
+                json.dump(insights, f, indent=2, default=str)
         
         # Save processed data sample with enhanced features
         columns_to_save = [
@@ -461,13 +573,17 @@ class OptimizedEmployeeSWOTMLTK:
         if 'attrition_probability' in self.df.columns:
             columns_to_save.extend(['attrition_probability', 'attrition_risk_level'])
             
-        enhanced_sample = self.df[columns_to_save].head(1000)
-        
-        enhanced_sample.to_csv(
-            os.path.join(self.model_dir, 'enhanced_sample_data.csv'), 
-            index=False
+        # Scores keep full precision for the models; round only for export
+        enhanced_sample = self.df[columns_to_save].head(1000).round(
+            {'productivity_score': 2, 'engagement_score': 2, 'risk_score': 2}
         )
         
+        sample_path = os.path.join(self.model_dir, 'enhanced_sample_data.csv')
+        if pa is not None:
+            pacsv.write_csv(pa.Table.from_pandas(enhanced_sample, preserve_index=False), sample_path)
+        else:
+            enhanced_sample.to_csv(sample_path, index=False)
+        
         print(f"✅ All enhanced models saved to: {self.model_dir}/")
         
     def run_complete_analysis(self):
@@ -0,0 +1,42 @@
+"""
+Shared helpers for the MLTK model training scripts
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+def read_csv_columns(path, usecols, dtype):
+    """Read only usecols with explicit dtypes, using the pyarrow engine when installed"""
+    try:
+        return pd.read_csv(path, engine='pyarrow', usecols=usecols, dtype=dtype)
+    except ImportError:
+        # pyarrow not installed; the C parser still honours the column subset
+        return pd.read_csv(path, usecols=usecols, dtype=dtype)
+
+class UnionFeatureScaler:
+    """Standardize the union of several models' feature lists in one pass"""
+
+    def __init__(self, df, feature_sets):
+        self.features = sorted(set().union(*feature_sets))
+        # float32 halves memory traffic for the scaler and every estimator;
+        # X is a fresh array, so it can be standardized in place
+        X = df[self.features].fillna(0).to_numpy(np.float32)
+        self.scaler = StandardScaler(copy=False)
+        self.X_scaled = self.scaler.fit_transform(X)
+
+    def subset(self, features):
+        """Return scaled columns for features and a StandardScaler matching them"""
+        idx = [self.features.index(f) for f in features]
+
+        # Per-column stats are independent, so the union stats slice exactly
+        scaler = StandardScaler()
+        scaler.mean_ = self.scaler.mean_[idx]
+        scaler.var_ = self.scaler.var_[idx]
+        scaler.scale_ = self.scaler.scale_[idx]
+        scaler.n_samples_seen_ = self.scaler.n_samples_seen_
+        scaler.n_features_in_ = len(idx)
+        # Keep the column-name check a DataFrame-fitted scaler would do at inference
+        scaler.feature_names_in_ = np.asarray(features, dtype=object)
+
+        return self.X_scaled[:, idx], scaler
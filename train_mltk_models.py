@@ -6,17 +6,53 @@ This script sets up and trains the MLTK models for employee productivity monitor
 
 import pandas as pd
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.ensemble import IsolationForest
 from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score
+from mltk_common import UnionFeatureScaler, read_csv_columns
 import joblib
 import json
 import os
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Inputs to the productivity/engagement/risk scores, in create_features unpacking order
+SCORE_INPUT_COLUMNS = [
+    'Performance_Score', 'Work_Hours_Per_Week', 'Projects_Handled',
+    'Training_Hours', 'Sick_Days', 'Employee_Satisfaction_Score',
+    'Overtime_Hours', 'Promotions'
+]
+
+SWOT_CATEGORIES = ['Strength', 'Weakness', 'Opportunity', 'Threat']
+
+# Raw columns the trainer reads, in file order so both parsers return the same
+# layout. Gender, Age, Hire_Date, Education_Level, Monthly_Salary,
+# Remote_Work_Frequency and Team_Size are skipped, so sample_processed_data.csv
+# does not carry them.
+USECOLS = [
+    'Employee_ID', 'Department', 'Job_Title', 'Years_At_Company',
+    'Performance_Score', 'Work_Hours_Per_Week', 'Projects_Handled',
+    'Overtime_Hours', 'Sick_Days', 'Training_Hours', 'Promotions',
+    'Employee_Satisfaction_Score', 'Resigned'
+]
+DTYPES = {col: 'float32' for col in SCORE_INPUT_COLUMNS + ['Years_At_Company']}
+# The only fractional input; float32 would leak representation error into the scores
+DTYPES['Employee_Satisfaction_Score'] = 'float64'
+# Categorical so Department/Job_Title groupbys hash integer codes; Resigned stays bool
+DTYPES.update({'Department': 'category', 'Job_Title': 'category'})
+
 class EmployeeSWOTMLTK:
     def __init__(self, data_path):
         """Initialize the MLTK trainer with employee data"""
@@ -27,22 +63,35 @@ class EmployeeSWOTMLTK:
         os.makedirs(self.model_dir, exist_ok=True)
         
         # Define feature columns for different models
+        # Attrition features; risk_score is left out because it is built from Resigned
         self.feature_columns = [
-            'productivity_score', 'engagement_score', 'risk_score', 
+            'productivity_score', 'engagement_score',
             'Work_Hours_Per_Week', 'Overtime_Hours', 'Sick_Days', 
             'Employee_Satisfaction_Score', 'Performance_Score',
             'Projects_Handled', 'Training_Hours'
         ]
+        self.clustering_features = [
+            'productivity_score', 'engagement_score', 'risk_score', 
+            'work_life_balance_score', 'tenure_factor'
+        ]
+        self.anomaly_features = [
+            'productivity_score', 'engagement_score', 'risk_score', 
+            'Work_Hours_Per_Week', 'Sick_Days', 'Overtime_Hours'
+        ]
         
         self.load_data()
+        self.prepare_feature_matrix()
         
     def load_data(self):
         """Load and preprocess employee data"""
         print("Loading employee data...")
         
-        self.df = pd.read_csv(self.data_path)
+        self.df = read_csv_columns(self.data_path, USECOLS, DTYPES)
         print(f"Loaded {len(self.df)} employee records")
         
+        # Resigned may parse as bool or as 'True'/'False'; normalize it once
+        self._resigned_int = self.df['Resigned'].astype(str).str.lower().eq('true').astype(np.int8)
+        
         # Feature Engineering
         self.create_features()
         
@@ -50,60 +99,54 @@ class EmployeeSWOTMLTK:
         """Create productivity, engagement, and risk scores"""
         print("Engineering features...")
         
-        # Productivity Score
-        self.df['productivity_score'] = (
-            (self.df['Performance_Score'] * 2 + 
-             (self.df['Work_Hours_Per_Week']/40) + 
-             (self.df['Projects_Handled']/10) + 
-             (self.df['Training_Hours']/50) - 
-             (self.df['Sick_Days']/5) + 
-             (self.df['Employee_Satisfaction_Score']/5)) / 6
-        ).round(2)
-        
-        # Engagement Score
-        self.df['engagement_score'] = (
-            (self.df['Employee_Satisfaction_Score'] + 
-             (self.df['Training_Hours']/10) + 
-             (self.df['Promotions']*2) - 
-             (self.df['Sick_Days']*0.5)) / 4
-        ).round(2)
-        
-        # Risk Score
-        self.df['risk_score'] = (
-            (self.df['Sick_Days'] + 
-             self.df['Overtime_Hours']/10 + 
-             (self.df['Resigned'].map({'True': 5, 'False': 0})) + 
-             (5 - self.df['Performance_Score']) - 
-             self.df['Employee_Satisfaction_Score']) / 5
-        ).round(2)
-        
-        # Work-life balance score
-        self.df['work_life_balance_score'] = self.df['Overtime_Hours'].apply(
-            lambda x: 5 if x <= 5 else 4 if x <= 15 else 3 if x <= 25 else 2
+        # Scores use the props.conf operation order in float64: a fused GEMM or
+        # float32 inputs move enough values across the .xx5 rounding ties to
+        # change thousands of 2-decimal scores
+        perf, hours, projects, training, sick, sat, overtime, promotions = (
+            self.df[col].to_numpy(dtype=np.float64) for col in SCORE_INPUT_COLUMNS
         )
+        resigned = self._resigned_int.to_numpy(dtype=np.float64) * 5
         
-        # Tenure factor
-        self.df['tenure_factor'] = self.df['Years_At_Company'].apply(
-            lambda x: 1 if x <= 1 else 2 if x <= 3 else 3 if x <= 5 else 4
-        )
+        productivity = (perf * 2 + hours / 40 + projects / 10 + training / 50 - sick / 5 + sat / 5) / 6
+        engagement = (sat + training / 10 + promotions * 2 - sick * 0.5) / 4
+        risk = (sick + overtime / 10 + resigned + (5 - perf) - sat) / 5
+        
+        self.df['productivity_score'] = np.round(productivity, 2)
+        self.df['engagement_score'] = np.round(engagement, 2)
+        self.df['risk_score'] = np.round(risk, 2)
+        
+        # Work-life balance score: <=5h -> 5, <=15h -> 4, <=25h -> 3, else 2
+        wlb_bins = np.array([5, 15, 25])
+        wlb_scores = np.array([5, 4, 3, 2])
+        self.df['work_life_balance_score'] = wlb_scores[
+            np.searchsorted(wlb_bins, self.df['Overtime_Hours'].to_numpy())
+        ]
+        
+        # Tenure factor: <=1y -> 1, <=3y -> 2, <=5y -> 3, else 4
+        tenure_bins = np.array([1, 3, 5])
+        tenure_scores = np.array([1, 2, 3, 4])
+        self.df['tenure_factor'] = tenure_scores[
+            np.searchsorted(tenure_bins, self.df['Years_At_Company'].to_numpy())
+        ]
         
         print("Feature engineering completed")
         
+    def prepare_feature_matrix(self):
+        """Standardize the union of all model features once"""
+        self.feature_matrix = UnionFeatureScaler(
+            self.df, [self.clustering_features, self.anomaly_features, self.feature_columns]
+        )
+        
     def train_clustering_model(self):
         """Train K-Means clustering for SWOT categorization"""
         print("="*50)
         print("Training K-Means clustering model...")
         
-        features = ['productivity_score', 'engagement_score', 'risk_score', 
-                   'work_life_balance_score', 'tenure_factor']
-        X = self.df[features].fillna(0)
-        
-        # Standardize features
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
+        # Standardized features
+        X_scaled, scaler = self.feature_matrix.subset(self.clustering_features)
         
-        # Train K-Means with 4 clusters (for SWOT categories)
-        kmeans = KMeans(n_clusters=4, random_state=42, n_init=10)
+        # Train mini-batch K-Means with 4 clusters (for SWOT categories)
+        kmeans = MiniBatchKMeans(n_clusters=4, batch_size=4096, n_init=3, random_state=42)
         clusters = kmeans.fit_predict(X_scaled)
         
         self.df['cluster'] = clusters
@@ -134,39 +177,36 @@ class EmployeeSWOTMLTK:
         avg_risk = self.df['risk_score'].mean()
         
         # Assign SWOT categories based on cluster performance vs averages
-        swot_mapping = {}
-        for cluster in range(4):
-            prod = cluster_stats.loc[cluster, 'productivity_score']
-            eng = cluster_stats.loc[cluster, 'engagement_score']
-            risk = cluster_stats.loc[cluster, 'risk_score']
-            
-            if prod > avg_productivity and eng > avg_engagement and risk < avg_risk:
-                swot_mapping[cluster] = 'Strength'
-            elif prod < avg_productivity and eng < avg_engagement:
-                swot_mapping[cluster] = 'Weakness'
-            elif risk > avg_risk and (prod < avg_productivity or eng < avg_engagement):
-                swot_mapping[cluster] = 'Threat'
-            else:
-                swot_mapping[cluster] = 'Opportunity'
-        
-        self.df['swot_category'] = self.df['cluster'].map(swot_mapping)
-        self.swot_mapping = swot_mapping
+        prod = cluster_stats['productivity_score'].to_numpy()
+        eng = cluster_stats['engagement_score'].to_numpy()
+        risk = cluster_stats['risk_score'].to_numpy()
+        
+        is_strength = (prod > avg_productivity) & (eng > avg_engagement) & (risk < avg_risk)
+        is_weakness = (prod < avg_productivity) & (eng < avg_engagement)
+        is_threat = (risk > avg_risk) & ((prod < avg_productivity) | (eng < avg_engagement))
+        codes = np.select(
+            [is_strength, is_weakness, is_threat], [0, 1, 3], default=2
+        ).astype(np.int8)
+        labels = np.array(SWOT_CATEGORIES)[codes]
+        
+        # Per-row lookup: cluster ids index straight into the SWOT_CATEGORIES codes
+        lookup = np.empty(cluster_stats.index.max() + 1, dtype=np.int8)
+        lookup[cluster_stats.index.to_numpy()] = codes
+        self.df['swot_category'] = pd.Categorical.from_codes(
+            lookup[self.df['cluster'].to_numpy()], categories=SWOT_CATEGORIES
+        )
+        self.swot_mapping = dict(zip(cluster_stats.index.tolist(), labels.tolist()))
         
     def train_anomaly_detection(self):
         """Train Isolation Forest for anomaly detection"""
         print("="*50)
         print("Training anomaly detection model...")
         
-        features = ['productivity_score', 'engagement_score', 'risk_score', 
-                   'Work_Hours_Per_Week', 'Sick_Days', 'Overtime_Hours']
-        X = self.df[features].fillna(0)
-        
-        # Standardize features
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
+        # Standardized features
+        X_scaled, scaler = self.feature_matrix.subset(self.anomaly_features)
         
         # Train Isolation Forest
-        iso_forest = IsolationForest(contamination=0.1, random_state=42)
+        iso_forest = IsolationForest(n_estimators=100, contamination=0.1, random_state=42, n_jobs=-1)
         outliers = iso_forest.fit_predict(X_scaled)
         
         self.df['outlier'] = (outliers == -1).astype(int)
@@ -183,12 +223,11 @@ class EmployeeSWOTMLTK:
         print("="*50)
         print("Training attrition prediction model...")
 
-        # Extract features and target
-        X = self.df[self.feature_columns].fillna(0)
-        y_raw = self.df['Resigned']
+        # Extract standardized features and target
+        X_scaled, scaler = self.feature_matrix.subset(self.feature_columns)
 
-        # Convert True/False or string to integer (binary classification: 1 = Resigned)
-        y = y_raw.astype(str).str.lower().map({'true': 1, 'false': 0}).fillna(0).astype(int)
+        # Binary classification target: 1 = Resigned
+        y = self._resigned_int.astype(int)
 
         # ⚠️ Check for at least 2 classes in target
         unique_classes = y.nunique()
@@ -197,11 +236,12 @@ class EmployeeSWOTMLTK:
             return
 
         # Continue with training if classes are valid
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
-
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
+        # Split row indices and slice the shared scaled matrix; the full
+        # matrix is scored below as-is, so nothing is standardized twice
+        train_idx, test_idx, y_train, y_test = train_test_split(
+            np.arange(len(X_scaled)), y, test_size=0.2, random_state=42, stratify=y
+        )
+        X_train_scaled, X_test_scaled = X_scaled[train_idx], X_scaled[test_idx]
 
         lr_model = LogisticRegression(max_iter=1000, random_state=42)
         lr_model.fit(X_train_scaled, y_train)
@@ -215,13 +255,14 @@ class EmployeeSWOTMLTK:
         print(f"Train accuracy: {train_score:.3f}")
         print(f"Test accuracy: {test_score:.3f}")
         print("\nClassification Report:")
-        print(classification_report(y_test, y_pred))
+        print(classification_report(y_test, y_pred, zero_division=0))
         
         # Predict probabilities for all data
-        X_scaled = scaler.transform(X)
         self.df['attrition_probability'] = lr_model.predict_proba(X_scaled)[:, 1]
-        self.df['attrition_risk_level'] = self.df['attrition_probability'].apply(
-            lambda x: 'Very High' if x > 0.7 else 'High' if x > 0.5 else 'Medium' if x > 0.3 else 'Low' if x > 0.1 else 'Very Low'
+        self.df['attrition_risk_level'] = pd.cut(
+            self.df['attrition_probability'].to_numpy(),
+            bins=[-np.inf, 0.1, 0.3, 0.5, 0.7, np.inf],
+            labels=['Very Low', 'Low', 'Medium', 'High', 'Very High']
         )
 
         # Save the model and scaler
@@ -246,7 +287,7 @@ class EmployeeSWOTMLTK:
         }
         
         # Department-wise analysis
-        dept_analysis = self.df.groupby('Department').agg({
+        dept_analysis = self.df.groupby('Department', observed=True).agg({
             'swot_category': lambda x: (x == 'Threat').sum(),
             'Employee_ID': 'count',
             'productivity_score': 'mean',
@@ -259,16 +300,32 @@ class EmployeeSWOTMLTK:
         
         # High risk employees
         if 'attrition_risk_level' in self.df.columns:
-            high_risk = self.df[
+            high_risk_mask = (
                 (self.df['swot_category'] == 'Threat') | 
                 (self.df['attrition_risk_level'].isin(['Very High', 'High']))
-            ][['Employee_ID', 'Department', 'Job_Title', 'swot_category', 'attrition_risk_level', 
-               'productivity_score', 'engagement_score', 'risk_score']].to_dict('records')
+            )
+            high_risk = self.df.loc[high_risk_mask, [
+                'Employee_ID', 'Department', 'Job_Title', 'swot_category', 'attrition_risk_level', 
+                'productivity_score', 'engagement_score', 'risk_score'
+            ]].nlargest(20, 'risk_score')  # Top 20 high-risk employees
             
-            insights['high_risk_employees'] = high_risk[:20]  # Top 20 high-risk employees
+            insights['high_risk_employees'] = high_risk.to_dict('records')
         
         return insights
         
+    @staticmethod
+    def _write_json(path, data):
+        """Write data as indented JSON, using orjson when it is installed"""
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(
+                    data, default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
+
     def save_models(self):
         """Save trained models and metadata"""
         # Save models
@@ -283,17 +340,22 @@ class EmployeeSWOTMLTK:
             
         # Save SWOT mapping
         if hasattr(self, 'swot_mapping'):
-            with open(os.path.join(self.model_dir, 'swot_mapping.json'), 'w') as f:
-                json.dump(self.swot_mapping, f, indent=2)
+            self._write_json(os.path.join(self.model_dir, 'swot_mapping.json'), self.swot_mapping)
                 
         # Save processed data sample
-        sample_data = self.df.head(1000).to_csv(os.path.join(self.model_dir, 'sample_processed_data.csv'), index=False)
+        sample = self.df.head(1000)
+        sample_path = os.path.join(self.model_dir, 'sample_processed_data.csv')
+        if pa is not None:
+            # Arrow writes booleans as true/false; keep the True/False the Splunk searches match on
+            sample = sample.astype({col: str for col in sample.select_dtypes(bool).columns})
+            pacsv.write_csv(pa.Table.from_pandas(sample, preserve_index=False), sample_path)
+        else:
+            sample.to_csv(sample_path, index=False)
         print(f"Saved sample processed data")
         
         # Save insights
         insights = self.generate_insights()
-        with open(os.path.join(self.model_dir, 'model_insights.json'), 'w') as f:
-            json.dump(insights, f, indent=2, default=str)
+        self._write_json(os.path.join(self.model_dir, 'model_insights.json'), insights)
             
         print(f"All models and artifacts saved to {self.model_dir}/")
         
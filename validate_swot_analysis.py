@@ -1,29 +1,208 @@
 #!/usr/bin/env python3
 """
 Employee SWOT Analysis Data Validation Script
-Simple validation without external dependencies
+Lightweight validation using pandas/NumPy vectorized scoring
 """
 
-import csv
 import json
 from collections import defaultdict
-import statistics
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Plain-ASCII status markers so the report renders the same in any console/codepage
+ALERT_MARK = "[ALERT]"
+WARNING_MARK = "[WARN]"
+OK_MARK = "[OK]"
+DEPT_MARK = "[DEPT]"
+
+# Raw CSV columns the validator scores and reports on
+NUMERIC_COLUMNS = [
+    'Performance_Score', 'Work_Hours_Per_Week', 'Projects_Handled',
+    'Training_Hours', 'Sick_Days', 'Employee_Satisfaction_Score',
+    'Overtime_Hours', 'Promotions'
+]
+# Identifier and label columns the report prints
+TEXT_COLUMNS = ['Employee_ID', 'Department', 'Job_Title']
+USECOLS = TEXT_COLUMNS + NUMERIC_COLUMNS + ['Resigned']
+# float64 plus _python_round keep compute_scores identical to calculate_scores
+DTYPES = {col: np.float64 for col in NUMERIC_COLUMNS}
+DTYPES.update({col: str for col in TEXT_COLUMNS})
+
+# DataFrame column -> record key for the employee lists in the analysis
+HIGH_RISK_FIELDS = {
+    'Employee_ID': 'Employee_ID',
+    'Department': 'Department',
+    'Job_Title': 'Job_Title',
+    'swot_category': 'SWOT_Category',
+    'productivity_score': 'Productivity_Score',
+    'engagement_score': 'Engagement_Score',
+    'risk_score': 'Risk_Score',
+    'Performance_Score': 'Performance_Score',
+    'Employee_Satisfaction_Score': 'Satisfaction_Score'
+}
+TOP_PERFORMER_FIELDS = {
+    'Employee_ID': 'Employee_ID',
+    'Department': 'Department',
+    'Job_Title': 'Job_Title',
+    'productivity_score': 'Productivity_Score',
+    'engagement_score': 'Engagement_Score',
+    'Performance_Score': 'Performance_Score'
+}
+
+# Single-core timing: the kernel saves ~26 ns/row of compute_scores' ~170 ns/row
+# (the Resigned string parse and missing-value scan dominate either way), and
+# loading it from the cache costs ~155 ms per run, so the break-even is ~6M rows
+NUMBA_MIN_ROWS = 6_000_000
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _score_kernel(perf, hours, projects, training, sick, sat, overtime, promotions,
+                      resigned, out_prod, out_eng, out_risk):
+        """Write unrounded productivity, engagement, and risk scores into the out arrays"""
+        # Same operation order as compute_scores so results stay bit-identical
+        for i in prange(perf.size):
+            out_prod[i] = (perf[i] * 2 + hours[i] / 40 + projects[i] / 10 + training[i] / 50
+                           - sick[i] / 5 + sat[i] / 5) / 6
+            out_eng[i] = (sat[i] + training[i] / 10 + promotions[i] * 2 - sick[i] * 0.5) / 4
+            out_risk[i] = (sick[i] + overtime[i] / 10 + resigned[i] * 5 + (5 - perf[i])
+                           - sat[i]) / 5
 
 def load_and_analyze_data(file_path):
-    """Load CSV data and perform basic analysis"""
+    """Load CSV data into a DataFrame of the columns used for scoring"""
     print("Loading employee data...")
     
-    employees = []
-    with open(file_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            employees.append(row)
+    employees = pd.read_csv(file_path, usecols=USECOLS, dtype=DTYPES)
+    # Blank text cells read as '' (as csv.DictReader gave them), not NaN
+    employees[TEXT_COLUMNS] = employees[TEXT_COLUMNS].fillna('')
     
     print(f"Loaded {len(employees)} employee records")
     return employees
 
+def compute_scores(df):
+    """Vectorized productivity, engagement, and risk scores for every row"""
+    resigned = df['Resigned'].astype(str).str.strip().eq('True')
+    
+    if njit is not None and len(df) >= NUMBA_MIN_ROWS:
+        scores = _kernel_scores(df, resigned)
+    else:
+        scores = _expression_scores(df, resigned)
+    return _zero_incomplete_rows(df, tuple(_python_round(score) for score in scores))
+
+def _python_round(score):
+    """Round to 2 decimals exactly as Python's round() does in calculate_scores"""
+    values = score.to_numpy(dtype=np.float64, copy=True)
+    rounded = np.round(values, 2)
+    # np.round scales by 100 before rounding, which can tip values that sit on a
+    # .xx5 tie; only those need Python's exact decimal rounding
+    scaled = values * 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    rounded[near_tie] = [round(value, 2) for value in values[near_tie].tolist()]
+    return pd.Series(rounded, index=score.index)
+
+def _expression_scores(df, resigned):
+    """Unrounded productivity, engagement, and risk scores as pandas expressions"""
+    performance_score = df['Performance_Score']
+    work_hours = df['Work_Hours_Per_Week']
+    projects = df['Projects_Handled']
+    training_hours = df['Training_Hours']
+    sick_days = df['Sick_Days']
+    satisfaction = df['Employee_Satisfaction_Score']
+    overtime = df['Overtime_Hours']
+    promotions = df['Promotions']
+    
+    # Productivity Score
+    productivity_score = (
+        performance_score * 2 + 
+        (work_hours/40) + 
+        (projects/10) + 
+        (training_hours/50) - 
+        (sick_days/5) + 
+        (satisfaction/5)
+    ) / 6
+    
+    # Engagement Score  
+    engagement_score = (
+        satisfaction + 
+        (training_hours/10) + 
+        (promotions*2) - 
+        (sick_days*0.5)
+    ) / 4
+    
+    # Risk Score
+    risk_score = (
+        sick_days + 
+        overtime/10 + 
+        resigned * 5 + 
+        (5 - performance_score) - 
+        satisfaction
+    ) / 5
+    
+    return productivity_score, engagement_score, risk_score
+
+def _kernel_scores(df, resigned):
+    """Unrounded productivity, engagement, and risk scores from _score_kernel"""
+    n = len(df)
+    out_prod, out_eng, out_risk = np.empty(n), np.empty(n), np.empty(n)
+    _score_kernel(*(df[col].to_numpy(np.float64) for col in NUMERIC_COLUMNS),
+                  resigned.to_numpy(np.int8), out_prod, out_eng, out_risk)
+    return tuple(pd.Series(out, index=df.index) for out in (out_prod, out_eng, out_risk))
+
+def check_kernel_parity(df):
+    """Compare _score_kernel with the pandas expressions on df; True when bit-identical"""
+    resigned = df['Resigned'].astype(str).str.strip().eq('True')
+    mismatched = np.zeros(len(df), dtype=bool)
+    for kernel, expression in zip(_kernel_scores(df, resigned), _expression_scores(df, resigned)):
+        kernel, expression = kernel.to_numpy(), expression.to_numpy(np.float64)
+        mismatched |= (kernel != expression) & ~(np.isnan(kernel) & np.isnan(expression))
+    
+    count = int(mismatched.sum())
+    if count:
+        print(f"{WARNING_MARK} Numba score kernel disagrees with the pandas expressions "
+              f"for {count} employees")
+    else:
+        print(f"{OK_MARK} Numba score kernel matches the pandas expressions")
+    return count == 0
+
+def _zero_incomplete_rows(df, scores):
+    """Report rows with a missing score input and give them 0 scores (so they land in Threat)"""
+    missing = df[NUMERIC_COLUMNS].isna()
+    incomplete = missing.any(axis=1).to_numpy()
+    if not incomplete.any():
+        return scores
+    
+    columns = np.array(NUMERIC_COLUMNS)
+    for employee_id, row_missing in zip(df['Employee_ID'].to_numpy()[incomplete],
+                                        missing.to_numpy()[incomplete]):
+        print(f"Error calculating scores for employee {employee_id}: "
+              f"missing {', '.join(columns[row_missing])}")
+    return tuple(score.mask(incomplete, 0.0) for score in scores)
+
+def assign_swot_categories(productivity_score, engagement_score, risk_score):
+    """Vectorized SWOT category for each employee (first matching rule wins)"""
+    prod = np.asarray(productivity_score)
+    eng = np.asarray(engagement_score)
+    risk = np.asarray(risk_score)
+    
+    cond_s = (prod >= 3.5) & (eng >= 3.5) & (risk <= 2)
+    cond_t = (prod < 2.5) | (eng < 2.5) | (risk >= 4)
+    cond_w = (prod >= 2.5) & (prod < 3.5) & (eng >= 2.5) & (eng < 3.5)
+    
+    return np.select([cond_s, cond_t, cond_w], ["Strength", "Threat", "Weakness"], "Opportunity")
+
 def calculate_scores(employee):
-    """Calculate productivity, engagement, and risk scores"""
+    """Calculate productivity, engagement, and risk scores for a single employee record"""
+    # Plain scalar math: building a one-row DataFrame costs milliseconds per call
     try:
         # Convert string values to numbers
         performance_score = float(employee['Performance_Score'])
@@ -34,7 +213,7 @@ def calculate_scores(employee):
         satisfaction = float(employee['Employee_Satisfaction_Score'])
         overtime = float(employee['Overtime_Hours'])
         promotions = float(employee['Promotions'])
-        resigned = employee['Resigned'].strip()
+        resigned = str(employee['Resigned']).strip()
         
         # Productivity Score
         productivity_score = round((
@@ -70,7 +249,7 @@ def calculate_scores(employee):
         return 0, 0, 0
 
 def assign_swot_category(productivity_score, engagement_score, risk_score):
-    """Assign SWOT category based on scores"""
+    """Assign SWOT category for a single employee's scores"""
     if productivity_score >= 3.5 and engagement_score >= 3.5 and risk_score <= 2:
         return "Strength"
     elif productivity_score < 2.5 or engagement_score < 2.5 or risk_score >= 4:
@@ -84,81 +263,63 @@ def analyze_employees(employees):
     """Analyze all employees and generate insights"""
     print("Analyzing employee data...")
     
+    df = employees
+    df['productivity_score'], df['engagement_score'], df['risk_score'] = compute_scores(df)
+    df['swot_category'] = assign_swot_categories(
+        df['productivity_score'].to_numpy(),
+        df['engagement_score'].to_numpy(),
+        df['risk_score'].to_numpy()
+    )
+    swot_counts = df['swot_category'].value_counts()
+    
     analysis = {
-        'total_employees': len(employees),
-        'swot_distribution': defaultdict(int),
-        'department_analysis': defaultdict(lambda: {
-            'total': 0, 'strengths': 0, 'weaknesses': 0, 
-            'opportunities': 0, 'threats': 0,
-            'avg_productivity': [], 'avg_engagement': [], 'avg_risk': []
-        }),
+        'total_employees': len(df),
+        'swot_distribution': defaultdict(int, {cat: int(n) for cat, n in swot_counts.items()}),
+        'department_analysis': {},
         'high_risk_employees': [],
         'top_performers': [],
         'score_distributions': {
-            'productivity': [], 'engagement': [], 'risk': []
+            'productivity': df['productivity_score'].to_numpy(np.float32),
+            'engagement': df['engagement_score'].to_numpy(np.float32),
+            'risk': df['risk_score'].to_numpy(np.float32)
         }
     }
     
-    for employee in employees:
-        # Calculate scores
-        prod_score, eng_score, risk_score = calculate_scores(employee)
-        swot_category = assign_swot_category(prod_score, eng_score, risk_score)
-        
-        # Update distributions
-        analysis['swot_distribution'][swot_category] += 1
-        analysis['score_distributions']['productivity'].append(prod_score)
-        analysis['score_distributions']['engagement'].append(eng_score)
-        analysis['score_distributions']['risk'].append(risk_score)
-        
-        # Department analysis
-        dept = employee['Department']
-        dept_data = analysis['department_analysis'][dept]
-        dept_data['total'] += 1
-        
-        # Safely increment SWOT category counts
-        if swot_category == "Strength":
-            dept_data['strengths'] += 1
-        elif swot_category == "Weakness":
-            dept_data['weaknesses'] += 1
-        elif swot_category == "Opportunity":
-            dept_data['opportunities'] += 1
-        elif swot_category == "Threat":
-            dept_data['threats'] += 1
-        dept_data['avg_productivity'].append(prod_score)
-        dept_data['avg_engagement'].append(eng_score)
-        dept_data['avg_risk'].append(risk_score)
-        
-        # Collect high-risk and top performers
-        if swot_category == "Threat" or risk_score >= 4:
-            analysis['high_risk_employees'].append({
-                'Employee_ID': employee['Employee_ID'],
-                'Department': dept,
-                'Job_Title': employee['Job_Title'],
-                'SWOT_Category': swot_category,
-                'Productivity_Score': prod_score,
-                'Engagement_Score': eng_score,
-                'Risk_Score': risk_score,
-                'Performance_Score': employee['Performance_Score'],
-                'Satisfaction_Score': employee['Employee_Satisfaction_Score']
-            })
-            
-        if swot_category == "Strength" and prod_score >= 4:
-            analysis['top_performers'].append({
-                'Employee_ID': employee['Employee_ID'],
-                'Department': dept,
-                'Job_Title': employee['Job_Title'],
-                'Productivity_Score': prod_score,
-                'Engagement_Score': eng_score,
-                'Performance_Score': employee['Performance_Score']
-            })
-    
-    # Calculate department averages
-    for dept, data in analysis['department_analysis'].items():
-        if data['avg_productivity']:
-            data['avg_productivity'] = round(statistics.mean(data['avg_productivity']), 2)
-            data['avg_engagement'] = round(statistics.mean(data['avg_engagement']), 2) 
-            data['avg_risk'] = round(statistics.mean(data['avg_risk']), 2)
-            data['threat_percentage'] = round((data['threats'] / data['total']) * 100, 1)
+    # Collect high-risk and top performers
+    high_risk = df.loc[(df['swot_category'] == "Threat") | (df['risk_score'] >= 4), list(HIGH_RISK_FIELDS)]
+    analysis['high_risk_employees'] = high_risk.rename(columns=HIGH_RISK_FIELDS).to_dict('records')
+    
+    top = df.loc[(df['swot_category'] == "Strength") & (df['productivity_score'] >= 4), list(TOP_PERFORMER_FIELDS)]
+    analysis['top_performers'] = top.rename(columns=TOP_PERFORMER_FIELDS).to_dict('records')
+    
+    # Report leaders; nlargest keeps first-seen order on ties, like a stable sort
+    analysis['top_high_risk_employees'] = high_risk.nlargest(10, 'risk_score').rename(
+        columns=HIGH_RISK_FIELDS
+    ).to_dict('records')
+    analysis['top_productivity_performers'] = top.nlargest(10, 'productivity_score').rename(
+        columns=TOP_PERFORMER_FIELDS
+    ).to_dict('records')
+    
+    # Department analysis (departments kept in first-seen order)
+    g = df.groupby('Department', sort=False, dropna=False)
+    total = g.size()
+    averages = g[['productivity_score', 'engagement_score', 'risk_score']].mean().round(2)
+    swot_by_dept = df.groupby(['Department', 'swot_category'], sort=False, dropna=False).size().unstack(
+        fill_value=0
+    ).reindex(index=total.index, columns=['Strength', 'Weakness', 'Opportunity', 'Threat'], fill_value=0)
+    
+    department_frame = pd.DataFrame({
+        'total': total,
+        'strengths': swot_by_dept['Strength'],
+        'weaknesses': swot_by_dept['Weakness'],
+        'opportunities': swot_by_dept['Opportunity'],
+        'threats': swot_by_dept['Threat'],
+        'avg_productivity': averages['productivity_score'],
+        'avg_engagement': averages['engagement_score'],
+        'avg_risk': averages['risk_score'],
+        'threat_percentage': (swot_by_dept['Threat'] / total * 100).round(1)
+    })
+    analysis['department_analysis'] = department_frame.to_dict('index')
         
     return analysis
 
@@ -190,9 +351,9 @@ def generate_report(analysis):
     risk_scores = analysis['score_distributions']['risk']
     
     report.append("SCORE STATISTICS:")
-    report.append(f"  Productivity - Mean: {statistics.mean(prod_scores):.2f}, Median: {statistics.median(prod_scores):.2f}")
-    report.append(f"  Engagement  - Mean: {statistics.mean(eng_scores):.2f}, Median: {statistics.median(eng_scores):.2f}")
-    report.append(f"  Risk        - Mean: {statistics.mean(risk_scores):.2f}, Median: {statistics.median(risk_scores):.2f}")
+    report.append(f"  Productivity - Mean: {prod_scores.mean():.2f}, Median: {np.median(prod_scores):.2f}")
+    report.append(f"  Engagement  - Mean: {eng_scores.mean():.2f}, Median: {np.median(eng_scores):.2f}")
+    report.append(f"  Risk        - Mean: {risk_scores.mean():.2f}, Median: {np.median(risk_scores):.2f}")
     report.append("")
     
     # Department Analysis
@@ -213,7 +374,7 @@ def generate_report(analysis):
     # High Risk Employees
     report.append("HIGH RISK EMPLOYEES (Top 10):")
     report.append("-" * 35)
-    high_risk = sorted(analysis['high_risk_employees'], key=lambda x: x['Risk_Score'], reverse=True)[:10]
+    high_risk = analysis['top_high_risk_employees']
     
     if high_risk:
         report.append(f"{'ID':<6} {'Department':<15} {'SWOT':<12} {'Risk':<6} {'Prod':<6} {'Eng':<6}")
@@ -228,7 +389,7 @@ def generate_report(analysis):
     # Top Performers
     report.append("TOP PERFORMERS (Strengths - Top 10):")
     report.append("-" * 40)
-    top_performers = sorted(analysis['top_performers'], key=lambda x: x['Productivity_Score'], reverse=True)[:10]
+    top_performers = analysis['top_productivity_performers']
     
     if top_performers:
         report.append(f"{'ID':<6} {'Department':<15} {'Job Title':<15} {'Prod':<6} {'Eng':<6}")
@@ -249,30 +410,30 @@ def generate_report(analysis):
     threat_pct = (threat_count / total) * 100
     
     if threat_pct > 15:
-        report.append("🚨 CRITICAL: High threat percentage detected!")
+        report.append(f"{ALERT_MARK} CRITICAL: High threat percentage detected!")
         report.append("   - Implement immediate intervention programs")
         report.append("   - Schedule urgent leadership review")
     elif threat_pct > 10:
-        report.append("⚠️  WARNING: Elevated threat levels")
+        report.append(f"{WARNING_MARK} WARNING: Elevated threat levels")
         report.append("   - Increase manager-employee check-ins")
         report.append("   - Review workload and support systems")
     else:
-        report.append("✅ GOOD: Manageable threat levels")
+        report.append(f"{OK_MARK} GOOD: Manageable threat levels")
         report.append("   - Continue current practices")
     
     report.append("")
     high_risk_depts = [dept for dept, pct in dept_list if pct > 20]
     if high_risk_depts:
-        report.append(f"🏢 Departments requiring attention: {', '.join(high_risk_depts)}")
+        report.append(f"{DEPT_MARK} Departments requiring attention: {', '.join(high_risk_depts)}")
         report.append("   - Conduct departmental culture assessment")
         report.append("   - Implement targeted retention strategies")
     
     report.append("")
     report.append("SPLUNK MLTK IMPLEMENTATION READY:")
-    report.append("✅ Data structure validated")
-    report.append("✅ Feature engineering confirmed")
-    report.append("✅ SWOT categorization logic tested")
-    report.append("✅ Alert thresholds calibrated")
+    report.append(f"{OK_MARK} Data structure validated")
+    report.append(f"{OK_MARK} Feature engineering confirmed")
+    report.append(f"{OK_MARK} SWOT categorization logic tested")
+    report.append(f"{OK_MARK} Alert thresholds calibrated")
     
     return "\n".join(report)
 
@@ -291,7 +452,7 @@ def main():
         
         # Save analysis results
         output_file = "employee_swot_analysis_results.txt"
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with open(output_file, 'w', encoding='utf-8', newline='') as f:
             f.write(report)
         
         print(f"\n\nDetailed analysis saved to: {output_file}")
@@ -305,8 +466,12 @@ def main():
             'departments_at_risk': len([d for d in analysis['department_analysis'].values() if d['threat_percentage'] > 15])
         }
         
-        with open("swot_analysis_summary.json", 'w') as f:
-            json.dump(summary, f, indent=2)
+        if orjson is not None:
+            with open("swot_analysis_summary.json", 'wb') as f:
+                f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        else:
+            with open("swot_analysis_summary.json", 'w') as f:
+                json.dump(summary, f, indent=2)
             
         print("Summary saved to: swot_analysis_summary.json")
         